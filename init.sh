@@ -28,14 +28,25 @@ GITHUB_BRANCH="main"
 REPO_URL="https://github.com/${GITHUB_REPO}.git"
 REPO_DIR="${HOME}/workstation-setup"
 
+# Skip the implicit `brew update` and post-install cleanup on every brew call
+export HOMEBREW_NO_AUTO_UPDATE=1
+export HOMEBREW_NO_INSTALL_CLEANUP=1
+export HOMEBREW_NO_ANALYTICS=1
+export HOMEBREW_NO_ENV_HINTS=1
+
 # ========================================
 # UTILITIES
 # ========================================
 
-log()        { echo -e "\033[1;34m[INFO]\033[0m $1"; }
-warn()       { echo -e "\033[1;33m[WARN]\033[0m $1"; }
-success()    { echo -e "\033[1;32m[DONE]\033[0m $1"; }
-error_exit() { echo -e "\033[1;31m[ERROR]\033[0m $1"; exit 1; }
+readonly INFO_PREFIX=$'\033[1;34m[INFO]\033[0m'
+readonly WARN_PREFIX=$'\033[1;33m[WARN]\033[0m'
+readonly DONE_PREFIX=$'\033[1;32m[DONE]\033[0m'
+readonly ERROR_PREFIX=$'\033[1;31m[ERROR]\033[0m'
+
+log()        { printf '%s %s\n' "${INFO_PREFIX}" "$1"; }
+warn()       { printf '%s %s\n' "${WARN_PREFIX}" "$1"; }
+success()    { printf '%s %s\n' "${DONE_PREFIX}" "$1"; }
+error_exit() { printf '%s %s\n' "${ERROR_PREFIX}" "$1"; exit 1; }
 
 require_sudo() {
     sudo -v
@@ -85,6 +96,9 @@ ensure_xcode_and_homebrew() {
         success "Homebrew installed."
     else
         success "Homebrew already installed."
+        # Auto-update is disabled above, so refresh the index once explicitly
+        log "Updating Homebrew..."
+        brew update
     fi
 }
 